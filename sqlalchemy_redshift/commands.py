@@ -129,7 +129,10 @@ def _process_fixed_width(spec):
 
 class _ExecutableClause(sa_expression.Executable,
                         sa_expression.ClauseElement):
-    pass
+    # Subclasses keep their options in plain attributes that SQLAlchemy's
+    # cache key generation doesn't see, so each one opts out of the
+    # statement cache with ``inherit_cache = False``.
+    inherit_cache = False
 
 
 class AlterTableAppendCommand(_ExecutableClause):
@@ -159,6 +162,9 @@ class AlterTableAppendCommand(_ExecutableClause):
         fill those columns with the default column value or NULL. Mutually
         exclusive with `ignore_extra`.
     """
+
+    inherit_cache = False
+
     def __init__(self, source, target, ignore_extra=False, fill_target=False):
         if ignore_extra and fill_target:
             raise ValueError(
@@ -269,6 +275,8 @@ class UnloadFromSelect(_ExecutableClause):
         Indicates the type of file to unload to.
     """
 
+    inherit_cache = False
+
     def __init__(self, select, unload_location, access_key_id=None,
                  secret_access_key=None, session_token=None,
                  aws_partition='aws', aws_account_id=None, iam_role_name=None,
@@ -610,6 +618,8 @@ class CopyCommand(_ExecutableClause):
         cluster isn't in the same region as the S3 bucket.
     """
 
+    inherit_cache = False
+
     def __init__(self, to, data_location, access_key_id=None,
                  secret_access_key=None, session_token=None,
                  aws_partition='aws', aws_account_id=None, iam_role_name=None,
@@ -941,6 +951,9 @@ class CreateLibraryCommand(_ExecutableClause):
         The AWS region where the library's S3 bucket is located, if the
         Redshift cluster isn't in the same region as the S3 bucket.
     """
+
+    inherit_cache = False
+
     def __init__(self, library_name, location, access_key_id=None,
                  secret_access_key=None, session_token=None,
                  aws_account_id=None, iam_role_name=None, replace=False,
@@ -1019,6 +1032,9 @@ class RefreshMaterializedView(_ExecutableClause):
 
     This can be included in any execute() statement.
     """
+
+    inherit_cache = False
+
     def __init__(self, name):
         """
         Builds the Executable/ClauseElement that represents the refresh command
@@ -1,14 +1,21 @@
+import contextlib
 import importlib
+import importlib.abc
+import importlib.util
+import itertools
 import json
+import operator
 import re
+import sys
+import weakref
 from collections import defaultdict, namedtuple
 from logging import getLogger
 from typing import Any, Optional
 from pathlib import Path
+from types import MappingProxyType
 
 import sqlalchemy as sa
 from packaging.version import Version
-from sqlalchemy import inspect
 from sqlalchemy import util
 from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION, ENUM
 from sqlalchemy.dialects.postgresql.base import (PGCompiler, PGDDLCompiler,
@@ -20,6 +27,7 @@ from sqlalchemy.dialects.postgresql.psycopg2cffi import PGDialect_psycopg2cffi
 from sqlalchemy.engine import reflection
 from sqlalchemy.engine.default import DefaultDialect
 from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.elements import quoted_name
 from sqlalchemy.sql.expression import (BinaryExpression, BooleanClauseList,
                                        Delete)
 from sqlalchemy.sql.type_api import TypeEngine
@@ -35,24 +43,92 @@ from .ddl import (CreateMaterializedView, DropMaterializedView,
 from typing import List
 
 sa_version = Version(sa.__version__)
+# SQLAlchemy version checks used on hot paths, resolved once at import.
+_SA_GE_1_3 = sa_version >= Version('1.3.0')
+_SA_GE_1_3_16 = sa_version >= Version('1.3.16')
+_SA_GE_1_4 = sa_version >= Version('1.4.0')
 logger = getLogger(__name__)
 
-try:
-    import alembic
-except ImportError:
-    pass
-else:
-    from alembic.ddl import postgresql
-    from alembic.ddl.base import RenameTable
-    compiles(RenameTable, 'redshift')(postgresql.visit_rename_table)
 
-    if Version(alembic.__version__) >= Version('1.0.6'):
-        from alembic.ddl.base import ColumnComment
-        compiles(ColumnComment, 'redshift')(postgresql.visit_column_comment)
+def _register_alembic():
+    """
+    Register the Redshift implementation and DDL compilers with alembic.
+    """
+    global RedshiftImpl
+    from alembic.ddl import base, postgresql
+    compiles(base.RenameTable, 'redshift')(postgresql.visit_rename_table)
+
+    # ColumnComment is new in alembic 1.0.6
+    if hasattr(base, 'ColumnComment'):
+        compiles(base.ColumnComment, 'redshift')(
+            postgresql.visit_column_comment
+        )
 
     class RedshiftImpl(postgresql.PostgresqlImpl):
         __dialect__ = 'redshift'
 
+
+class _AlembicLoader(importlib.abc.Loader):
+    """
+    Wraps the loader of alembic's PostgreSQL module to register Redshift
+    support right after that module has been executed.
+    """
+
+    def __init__(self, loader):
+        self._loader = loader
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._loader.exec_module(module)
+        _register_alembic()
+
+
+class _AlembicImportHook(importlib.abc.MetaPathFinder):
+    """
+    Defers alembic registration until the application imports alembic,
+    so importing this dialect does not pull in alembic and its
+    dependencies.
+    """
+    module_name = 'alembic.ddl.postgresql'
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname != self.module_name:
+            return None
+        sys.meta_path.remove(self)
+        spec = importlib.util.find_spec(fullname)
+        if spec is not None and spec.loader is not None:
+            spec.loader = _AlembicLoader(spec.loader)
+        return spec
+
+
+def __getattr__(name):
+    # RedshiftImpl is only defined once alembic has been imported; asking
+    # for it imports alembic on demand, which registers it.
+    if name == 'RedshiftImpl':
+        try:
+            importlib.import_module(_AlembicImportHook.module_name)
+        except ImportError as exc:
+            raise AttributeError(
+                'RedshiftImpl requires alembic'
+            ) from exc
+        if 'RedshiftImpl' not in globals():
+            _register_alembic()
+        return globals()['RedshiftImpl']
+    raise AttributeError(
+        'module {!r} has no attribute {!r}'.format(__name__, name)
+    )
+
+
+if _AlembicImportHook.module_name in sys.modules:
+    _register_alembic()
+elif importlib.util.find_spec('alembic') is not None:
+    sys.meta_path.insert(0, _AlembicImportHook())
+
 # "Each dialect provides the full set of typenames supported by that backend
 # with its __all__ collection
 # https://docs.sqlalchemy.org/en/13/core/type_basics.html#vendor-specific-types
@@ -85,9 +161,43 @@ __all__ = (
 )
 
 
+def _verbose_to_plain(pattern):
+    """Strip the comments and insignificant whitespace of a verbose regex.
+
+    The patterns below are written in verbose form for readability but
+    compiled from the compact equivalent, so the compiled pattern objects
+    do not carry the layout around."""
+    plain = []
+    in_class = False
+    chars = iter(pattern)
+    for char in chars:
+        if char == '\\':
+            plain.append(char + next(chars, ''))
+        elif in_class:
+            plain.append(char)
+            in_class = char != ']'
+        elif char == '[':
+            plain.append(char)
+            in_class = True
+            # A ']' directly after '[' or '[^' is a literal.
+            for char in chars:
+                if char == '\\':
+                    char += next(chars, '')
+                plain.append(char)
+                if char != '^':
+                    break
+        elif char == '#':
+            for char in chars:
+                if char == '\n':
+                    break
+        elif not char.isspace():
+            plain.append(char)
+    return ''.join(plain)
+
+
 # Regex for parsing and identity constraint out of adsrc, e.g.:
 #   "identity"(445178, 0, '1,1'::text)
-IDENTITY_RE = re.compile(r"""
+IDENTITY_RE = re.compile(_verbose_to_plain(r"""
     "identity" \(
       (?P<current>-?\d+)
       ,\s
@@ -96,65 +206,133 @@ IDENTITY_RE = re.compile(r"""
       '(?P<seed>-?\d+),(?P<step>-?\d+)'
       .*
     \)
-""", re.VERBOSE)
+"""))
 
 # Regex for SQL identifiers (valid table and column names)
-SQL_IDENTIFIER_RE = re.compile(r"""
+SQL_IDENTIFIER_RE = re.compile(_verbose_to_plain(r"""
    [_a-zA-Z][\w$]*  # SQL standard identifier
    |                # or
    (?:"[^"]+")+     # SQL delimited (quoted) identifier
-""", re.VERBOSE)
+"""))
 
 # Regex for foreign key constraints, e.g.:
 #   FOREIGN KEY(col1) REFERENCES othertable (col2)
 # See https://docs.aws.amazon.com/redshift/latest/dg/r_names.html
 # for a definition of valid SQL identifiers.
-FOREIGN_KEY_RE = re.compile(r"""
+# The column lists are captured as a whole and split into identifiers with
+# SQL_IDENTIFIER_RE afterwards; matching each identifier inside a repeated
+# group here would allow catastrophic backtracking on malformed input.
+FOREIGN_KEY_RE = re.compile(_verbose_to_plain(r"""
   ^FOREIGN\ KEY \s* \(   # FOREIGN KEY, arbitrary whitespace, literal '('
     (?P<columns>         # Start a group to capture the referring columns
-      (?:                # Start a non-capturing group
-        \s*              # Arbitrary whitespace
-        ([_a-zA-Z][\w$]* | ("[^"]+")+)   # SQL identifier
-        \s*              # Arbitrary whitespace
-        ,?               # There will be a colon if this isn't the last one
-      )+                 # Close the non-capturing group; require at least one
+      (?:[^)"] | "[^"]*")+   # Anything up to ')', skipping quoted names
     )                    # Close the 'columns' group
-  \s* \)                 # Arbitrary whitespace and literal ')'
+  \)                     # Literal ')'
   \s* REFERENCES \s*
-    ((?P<referred_schema>([_a-zA-Z][\w$]* | ("[^"]*")+))\.)? # SQL identifier
-    (?P<referred_table>[_a-zA-Z][\w$]* | ("[^"]*")+)         # SQL identifier
-  \s* \(   # FOREIGN KEY, arbitrary whitespace, literal '('
-    (?P<referred_columns> # Start a group to capture the referring columns
-      (?:                # Start a non-capturing group
-        \s*              # Arbitrary whitespace
-        ([_a-zA-Z][\w$]* | ("[^"]+")+)   # SQL identifier
-        \s*              # Arbitrary whitespace
-        ,?               # There will be a colon if this isn't the last one
-      )+                 # Close the non-capturing group; require at least one
-    )                    # Close the 'columns' group
-  \s* \)                 # Arbitrary whitespace and literal ')'
-""", re.VERBOSE)
+    (?:(?P<referred_schema>[_a-zA-Z][\w$]* | (?:"[^"]*")+)\.)? # SQL identifier
+    (?P<referred_table>[_a-zA-Z][\w$]* | (?:"[^"]*")+)   # SQL identifier
+  \s* \(   # Arbitrary whitespace, literal '('
+    (?P<referred_columns> # Start a group to capture the referred columns
+      (?:[^)"] | "[^"]*")+   # Anything up to ')', skipping quoted names
+    )                    # Close the 'referred_columns' group
+  \)                     # Literal ')'
+"""))
 
 # Regex for primary key constraints, e.g.:
 #   PRIMARY KEY (col1, col2)
-PRIMARY_KEY_RE = re.compile(r"""
-  ^PRIMARY \s* KEY \s* \(  # FOREIGN KEY, arbitrary whitespace, literal '('
+# As with FOREIGN_KEY_RE, the column list is split with SQL_IDENTIFIER_RE.
+PRIMARY_KEY_RE = re.compile(_verbose_to_plain(r"""
+  ^PRIMARY \s* KEY \s* \(  # PRIMARY KEY, arbitrary whitespace, literal '('
     (?P<columns>         # Start a group to capture column names
-      (?:
-        \s*                # Arbitrary whitespace
-        # SQL identifier or delimited identifier
-        ( [_a-zA-Z][\w$]* | ("[^"]*")+ )
-        \s*                # Arbitrary whitespace
-        ,?                 # There will be a colon if this isn't the last one
-      )+                  # Close the non-capturing group; require at least one
+      (?:[^)"] | "[^"]*")+   # Anything up to ')', skipping quoted names
     )
-  \s* \) \s*                # Arbitrary whitespace and literal ')'
-""", re.VERBOSE)
+  \) \s*                 # Literal ')' and arbitrary whitespace
+"""))
+
+
+def _find_unquoted(text, targets, pos=0):
+    """Index of the first character of `targets` in `text` at or after `pos`
+    that is outside double quotes, or -1."""
+    quoted = False
+    for pos in range(pos, len(text)):
+        char = text[pos]
+        if char == '"':
+            quoted = not quoted
+        elif not quoted and char in targets:
+            return pos
+    return -1
+
+
+def _split_identifier_list(text, start):
+    """Split the parenthesized identifier list opening at ``text[start]``.
+
+    Returns the identifiers, quoted ones with their quotes, and the index
+    just past the closing parenthesis."""
+    if '"' not in text:
+        end = text.index(')', start)
+        names = [name.strip() for name in text[start + 1:end].split(',')]
+        return names, end + 1
+    names = []
+    pos = start
+    while True:
+        end = _find_unquoted(text, ',)', pos + 1)
+        if end < 0:
+            raise ValueError("Unterminated identifier list: %r" % text)
+        names.append(text[pos + 1:end].strip())
+        if text[end] == ')':
+            return names, end + 1
+        pos = end
+
+
+def _parse_primary_key(condef):
+    """Column names of a PRIMARY KEY definition, e.g.:
+        PRIMARY KEY (col1, col2)"""
+    return _split_identifier_list(condef, condef.index('('))[0]
+
+
+def _parse_foreign_key(condef):
+    """Split a FOREIGN KEY definition, e.g.:
+        FOREIGN KEY(col1) REFERENCES other_schema.othertable (col2)
+    into (columns, referred_schema, referred_table, referred_columns)."""
+    columns, pos = _split_identifier_list(condef, condef.index('('))
+    pos = condef.index('REFERENCES', pos) + len('REFERENCES')
+    paren = _find_unquoted(condef, '(', pos)
+    if paren < 0:
+        raise ValueError("No referred columns in %r" % condef)
+    referred = condef[pos:paren].strip()
+    dot = _find_unquoted(referred, '.')
+    referred_schema = referred[:dot] if dot >= 0 else None
+    referred_table = referred[dot + 1:]
+    referred_columns = _split_identifier_list(condef, paren)[0]
+    return columns, referred_schema, referred_table, referred_columns
+
+
+# Regex for the base type of a domain, e.g. "character varying" out of
+#   character varying(30)
+_DOMAIN_ATTYPE_RE = re.compile(r"[^(]+")
+
+# Regexes used to parse format_type() output in _get_column_info
+_ARRAY_SUFFIX_RE = re.compile(r"\[\]$")
+_PARENS_STRIP_RE = re.compile(r"\(.*\)")
+_CHARLEN_RE = re.compile(r"\(([\d,]+)\)")
+_ARGS_RE = re.compile(r"\((.*)\)")
+_COMMA_SPLIT_RE = re.compile(r"\s*,\s*")
+_INTERVAL_RE = re.compile(r"interval (.+)", re.I)
+_NEXTVAL_RE = re.compile(r"""(nextval\(')([^']+)('.*$)""")
+
+# Regex for CHECK constraint definitions, e.g.:
+#   CHECK (((a > 1) AND (a < 5))) NOT VALID
+_CHECK_CONSTRAINT_RE = re.compile(
+    r"^CHECK *\((.+)\)( NOT VALID)?$", flags=re.DOTALL
+)
+
+# Regex for client encoding names, e.g. UTF8, LATIN1 or ISO_8859_5
+_CLIENT_ENCODING_RE = re.compile(r"[A-Za-z0-9_\-]+\Z")
 
 # Reserved words as extracted from Redshift docs.
 # See pull_reserved_words.sh at the top level of this repository
 # for the code used to generate this set.
-RESERVED_WORDS = set([
+RESERVED_WORDS = frozenset([
     "aes128", "aes256", "all", "allowoverwrite", "analyse", "analyze",
     "and", "any", "array", "as", "asc", "authorization", "az64",
     "backup", "between", "binary", "blanksasnull", "both", "bytedict",
@@ -240,54 +418,41 @@ REFLECTION_SQL = """\
         c.tablename AS "table_name",
         c.columnname AS "name",
         null AS "encode",
-        -- Spectrum represents data types differently.
-        -- Standardize, so we can infer types.
-        CASE
-            WHEN c.external_type = 'int' THEN 'integer'
-            WHEN c.external_type = 'float' THEN 'real'
-            WHEN c.external_type = 'double' THEN 'double precision'
-            WHEN c.external_type = 'timestamp'
-            THEN 'timestamp without time zone'
-            WHEN c.external_type ilike 'varchar%'
-            THEN replace(c.external_type, 'varchar', 'character varying')
-            WHEN c.external_type ilike 'decimal%'
-            THEN replace(c.external_type, 'decimal', 'numeric')
-            ELSE
-            replace(
-            replace(
-                replace(c.external_type, 'decimal', 'numeric'),
-                'char', 'character'),
-            'varchar', 'character varying')
-            END
-            AS "type",
+        c.normalized_type AS "type",
         false AS "distkey",
         0 AS "sortkey",
         null AS "notnull",
         null as "comment",
         null AS "adsrc",
         c.columnnum AS "attnum",
-        CASE
-            WHEN c.external_type = 'int' THEN 'integer'
-            WHEN c.external_type = 'float' THEN 'real'
-            WHEN c.external_type = 'double' THEN 'double precision'
-            WHEN c.external_type = 'timestamp'
-            THEN 'timestamp without time zone'
-            WHEN c.external_type ilike 'varchar%'
-            THEN replace(c.external_type, 'varchar', 'character varying')
-            WHEN c.external_type ilike 'decimal%'
-            THEN replace(c.external_type, 'decimal', 'numeric')
-            ELSE
-            replace(
-            replace(
-                replace(c.external_type, 'decimal', 'numeric'),
-                'char', 'character'),
-            'varchar', 'character varying')
-            END
-            AS "format_type",
+        c.normalized_type AS "format_type",
         null AS "default",
         s.esoid AS "schema_oid",
         null AS "table_oid"
-    FROM svv_external_columns c
+    FROM (
+        SELECT schemaname, tablename, columnname, columnnum,
+            -- Spectrum represents data types differently.
+            -- Standardize, so we can infer types.
+            CASE
+                WHEN external_type = 'int' THEN 'integer'
+                WHEN external_type = 'float' THEN 'real'
+                WHEN external_type = 'double' THEN 'double precision'
+                WHEN external_type = 'timestamp'
+                THEN 'timestamp without time zone'
+                WHEN external_type ilike 'varchar%'
+                THEN replace(external_type, 'varchar', 'character varying')
+                WHEN external_type ilike 'decimal%'
+                THEN replace(external_type, 'decimal', 'numeric')
+                ELSE
+                replace(
+                replace(
+                    replace(external_type, 'decimal', 'numeric'),
+                    'char', 'character'),
+                'varchar', 'character varying')
+                END
+                AS normalized_type
+        FROM svv_external_columns
+    ) c
     JOIN svv_external_schemas s ON s.schemaname = c.schemaname
     WHERE 1 {schema_clause} {table_clause}
     UNION
@@ -313,18 +478,221 @@ REFLECTION_SQL = """\
     """
 
 
+RELATION_SQL = """\
+    SELECT
+      c.relkind,
+      n.oid as "schema_oid",
+      n.nspname as "schema",
+      c.oid as "rel_oid",
+      c.relname,
+      CASE c.reldiststyle
+        WHEN 0 THEN 'EVEN' WHEN 1 THEN 'KEY' WHEN 8 THEN 'ALL' END
+        AS "diststyle",
+      c.relowner AS "owner_id",
+      u.usename AS "owner_name",
+      TRIM(TRAILING ';' FROM pg_catalog.pg_get_viewdef(c.oid, true))
+        AS "view_definition",
+      pg_catalog.array_to_string(c.relacl, '\n') AS "privileges"
+    FROM pg_catalog.pg_class c
+         LEFT JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+         JOIN pg_catalog.pg_user u ON u.usesysid = c.relowner
+    WHERE c.relkind IN ('r', 'v', 'm', 'S', 'f')
+      AND n.nspname !~ '^pg_' {schema_clause} {relname_clause}
+      {relkind_clause}
+    UNION
+    SELECT
+        'r' AS "relkind",
+        s.esoid AS "schema_oid",
+        s.schemaname AS "schema",
+        null AS "rel_oid",
+        t.tablename AS "relname",
+        null AS "diststyle",
+        s.esowner AS "owner_id",
+        u.usename AS "owner_name",
+        null AS "view_definition",
+        null AS "privileges"
+    FROM
+        svv_external_tables t
+        JOIN svv_external_schemas s ON s.schemaname = t.schemaname
+        JOIN pg_catalog.pg_user u ON u.usesysid = s.esowner
+    where 1 {schema_clause} {relname_clause} {relkind_clause}
+    UNION
+    SELECT
+        'r' AS relkind,
+        NULL AS schema_oid,  -- Not available in svv_redshift_schemas
+        s.database_name || '.' || s.schema_name AS schema,
+        NULL AS rel_oid,
+        t.table_name AS relname,
+        NULL AS diststyle,
+        NULL AS owner_id,
+        NULL AS owner_name,
+        NULL AS view_definition,
+        NULL AS privileges
+    FROM
+        svv_redshift_tables t
+        LEFT JOIN svv_redshift_schemas s ON s.schema_name = t.schema_name
+    WHERE 1
+        {datashare_clause} {schema_clause} {relname_clause}
+        {relkind_clause}
+    ORDER BY "relkind", "schema_oid", "schema";
+    """
+
+CONSTRAINT_SQL = """\
+    SELECT
+      n.nspname as "schema",
+      c.relname as "table_name",
+      t.contype,
+      t.conname,
+      t.conkey,
+      a.attnum,
+      a.attname,
+      pg_catalog.pg_get_constraintdef(t.oid, true)::varchar(512) as condef,
+      n.oid as "schema_oid",
+      c.oid as "rel_oid"
+    FROM pg_catalog.pg_class c
+    LEFT JOIN pg_catalog.pg_namespace n
+      ON n.oid = c.relnamespace
+    JOIN pg_catalog.pg_constraint t
+      ON t.conrelid = c.oid
+    JOIN pg_catalog.pg_attribute a
+      ON t.conrelid = a.attrelid AND a.attnum = ANY(t.conkey)
+    WHERE n.nspname !~ '^pg_' {schema_clause} {table_clause}
+    UNION
+    SELECT
+        s.schemaname AS "schema",
+        c.tablename AS "table_name",
+        'p' as "contype",
+        c.tablename || '_pkey' as "conname",
+        array[1::SMALLINT] as "conkey",
+        1 as "attnum",
+        c.columnname as "attname",
+        'PRIMARY KEY (' || c.columnname  || ')'::VARCHAR(512) as "condef",
+        s.esoid AS "schema_oid",
+        null AS "rel_oid"
+    FROM
+        svv_external_columns c
+        JOIN svv_external_schemas s ON s.schemaname = c.schemaname
+    where 1 {schema_clause} {table_clause}
+    UNION
+    SELECT
+        c.database_name || '.' || c.schema_name AS "schema",
+        c.table_name AS "table_name",
+        'p' AS "contype",
+        c.table_name || '_pkey' AS "conname",
+        array[1::SMALLINT] AS "conkey",
+        1 AS "attnum",
+        c.column_name AS "attname",
+        'PRIMARY KEY (' || c.column_name || ')'::VARCHAR(512) AS "condef",
+        null AS "schema_oid",
+        null AS "rel_oid"
+    FROM
+        svv_redshift_columns c
+        JOIN svv_redshift_tables t ON t.schema_name = c.schema_name AND t.table_name = c.table_name
+    WHERE 1 {datashare_clause} {schema_clause} {unambiguous_tablename_clause}
+    ORDER BY "schema", "table_name"
+    """
+
+# Relations without CHECK constraints yield a single row with a NULL name,
+# so an absent relation can be told apart from one without constraints.
+CHECK_CONSTRAINT_SQL = """\
+    SELECT
+        n.nspname as "schema",
+        c.relname as "table_name",
+        cons.conname as name,
+        pg_get_constraintdef(cons.oid) as src
+    FROM
+        pg_catalog.pg_class c
+        JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+        LEFT JOIN pg_catalog.pg_constraint cons
+            ON cons.conrelid = c.oid AND cons.contype = 'c'
+    WHERE
+        c.relkind IN ('r', 'v', 'm', 'S', 'f') AND
+        {schema_clause}
+    ORDER BY "table_name", name
+    """
+
+
+def _sql_variants(template, filters=('schema', 'table', 'datashare'),
+                  **clauses):
+    """Format `template` once for every combination of reflection filters.
+
+    `clauses` maps each placeholder of `template` to a ``(filter, sql)``
+    pair, where `filter` is one of `filters`. The placeholder is filled
+    with `sql` when that filter is used and left empty otherwise. Filter
+    values are passed as bind parameters (``schema``, ``table_name``,
+    ``datashare``, ...), so each shape is a single static statement.
+
+    Returns text clauses keyed by a tuple of booleans in `filters` order,
+    by default ``(has_schema, has_table, has_datashare)``.
+    """
+    variants = {}
+    for shape in itertools.product((False, True), repeat=len(filters)):
+        used = dict(zip(filters, shape))
+        variants[shape] = sa.text(template.format(**{
+            placeholder: sql if used[name] else ''
+            for placeholder, (name, sql) in clauses.items()
+        }))
+    return variants
+
+
+_REFLECTION_SQL_VARIANTS = _sql_variants(
+    REFLECTION_SQL,
+    schema_clause=('schema', "AND schema = :schema"),
+    table_clause=('table', "AND table_name = :table_name"),
+    unambiguous_tablename_clause=(
+        'table', "AND c.table_name = :table_name"
+    ),
+    datashare_clause=('datashare', "AND c.database_name = :datashare "),
+)
+
+_RELATION_SQL_VARIANTS = _sql_variants(
+    RELATION_SQL,
+    filters=('schema', 'table', 'datashare', 'relkind'),
+    schema_clause=('schema', "AND schema = :schema"),
+    relname_clause=('table', "AND relname = :table_name"),
+    datashare_clause=('datashare', "AND s.database_name = :datashare"),
+    relkind_clause=('relkind', "AND relkind = :relkind"),
+)
+
+_CONSTRAINT_SQL_VARIANTS = _sql_variants(
+    CONSTRAINT_SQL,
+    schema_clause=('schema', "AND schema = :schema"),
+    table_clause=('table', "AND table_name = :table_name"),
+    unambiguous_tablename_clause=(
+        'table', "AND c.table_name = :table_name"
+    ),
+    datashare_clause=('datashare', "AND c.database_name = :datashare"),
+)
+
+# Keyed by whether a schema is given. Without one, the relations found
+# through the search_path are used, as for an unqualified table name,
+# leaving out the system schemas that are always on it.
+_CHECK_CONSTRAINT_SQL_VARIANTS = {
+    True: sa.text(CHECK_CONSTRAINT_SQL.format(
+        schema_clause="n.nspname = :schema"
+    )),
+    False: sa.text(CHECK_CONSTRAINT_SQL.format(
+        schema_clause=(
+            "pg_catalog.pg_table_is_visible(c.oid) AND "
+            "n.nspname !~ '^pg_' AND "
+            "n.nspname <> 'information_schema'"
+        )
+    )),
+}
+
+# Column and constraint rows arrive ordered by these, so they can be
+# grouped per relation with itertools.groupby.
+_schema_and_table = operator.attrgetter('schema', 'table_name')
+
+
 def parse_datashare(schema=None):
     """try and extract datashare from schema, if any
 
     returns datashare, schema, found_datashare"""
-    if not schema:
+    if not schema or "." not in schema or '"' in schema:
         return None, schema, False
-    has_datashare = "." in schema and '"' not in schema
-    if not has_datashare:
-        return None, schema, has_datashare
-    datashare = schema.split(".")[0] if has_datashare else ""
-    schema = schema.split(".")[1] if has_datashare else schema
-    return datashare, schema, has_datashare
+    datashare, _, schema = schema.partition(".")
+    return datashare, schema, True
 
 class RedshiftTypeEngine(TypeEngine):
 
@@ -469,7 +837,7 @@ class RelationKey(namedtuple('RelationKey', ('name', 'schema'))):
         if schema is None and connection is None:
             raise ValueError("Must specify either schema or connection")
         if schema is None:
-            schema = inspect(connection).default_schema_name
+            schema = connection.dialect.default_schema_name
         return super(RelationKey, cls).__new__(cls, name, schema)
 
     def __str__(self):
@@ -480,10 +848,7 @@ class RelationKey(namedtuple('RelationKey', ('name', 'schema'))):
 
     @staticmethod
     def _unquote(part):
-        if (
-                part is not None and part.startswith('"') and
-                part.endswith('"')
-        ):
+        if part is not None and len(part) >= 2 and part[0] == '"' == part[-1]:
             return part[1:-1]
         return part
 
@@ -633,7 +998,11 @@ class RedshiftDDLCompiler(PGDDLCompiler):
         default = self.get_column_default_string(column)
         if default is not None:
             # Identity constraints show up as *default* when reflected.
-            m = IDENTITY_RE.match(default)
+            # Check the prefix first to skip the regex for plain defaults.
+            m = (
+                IDENTITY_RE.match(default)
+                if default.startswith('"identity"(') else None
+            )
             if m:
                 colspec += " IDENTITY({seed},{step})".format(**m.groupdict())
             else:
@@ -647,7 +1016,7 @@ class RedshiftDDLCompiler(PGDDLCompiler):
 
     def _fetch_redshift_column_attributes(self, column):
         text = ""
-        if sa_version >= Version('1.3.0'):
+        if _SA_GE_1_3:
             info = column.dialect_options['redshift']
         else:
             if not hasattr(column, 'info'):
@@ -693,10 +1062,15 @@ class RedshiftTypeCompiler(PGTypeCompiler):
 class RedshiftIdentifierPreparer(PGIdentifierPreparer):
     reserved_words = RESERVED_WORDS
 
-    def quote_schema(self, schema: Any, force: Optional[bool] = ...) -> str:
+    def quote_schema(self, schema: Any, force: Optional[bool] = None) -> str:
         return schema
 
 
+# Key in ``Connection.info`` of the per-schema snapshots installed by
+# RedshiftDialectMixin.caching_schema().
+_REFLECTION_SNAPSHOTS_KEY = 'sqlalchemy_redshift_reflection_snapshots'
+
+
 class RedshiftDialectMixin(DefaultDialect):
     """
     Define Redshift-specific behavior.
@@ -737,19 +1111,24 @@ class RedshiftDialectMixin(DefaultDialect):
         }),
     ]
 
-    def __init__(self, *args, **kw):
-        super(RedshiftDialectMixin, self).__init__(*args, **kw)
-        # Cache domains, as these will be static;
-        # Redshift does not support user-created domains.
-        self._domains = None
+    # Cache domains, as these will be static;
+    # Redshift does not support user-created domains.
+    # Shared by all dialect instances and keyed by the connection URL
+    # (without password), so each engine does not have to query them again.
+    # The cache is emptied once it holds _domains_cache_size URLs, so
+    # processes creating engines for ever new URLs do not grow it forever.
+    _domains_cache = {}
+    _domains_cache_size = 64
 
-    @property
+    @util.memoized_property
     def ischema_names(self):
         """
         Returns information about datatypes supported by Amazon Redshift.
 
         Used in
         :meth:`~sqlalchemy.engine.dialects.postgresql.base.PGDialect._get_column_info`.
+        The mapping is built once per dialect instance, as it is looked up
+        for every reflected column.
         """
         return {
             **super(RedshiftDialectMixin, self).ischema_names,
@@ -796,7 +1175,7 @@ class RedshiftDialectMixin(DefaultDialect):
         for domain in c.mappings():
             domain = domain
             # strip (30) from character varying(30)
-            attype = re.search(r"([^\(]+)", domain["attype"]).group(1)
+            attype = _DOMAIN_ATTYPE_RE.match(domain["attype"]).group()
             # 'visible' just means whether or not the domain is in a
             # schema that's on the search path -- or not overridden by
             # a schema with higher precedence. If it's not visible,
@@ -814,6 +1193,17 @@ class RedshiftDialectMixin(DefaultDialect):
 
         return domains
 
+    def _get_domains(self, connection):
+        key = repr(connection.engine.url)
+        domains = self._domains_cache.get(key)
+        if domains is None:
+            domains = self._load_domains(connection)
+            if len(self._domains_cache) >= self._domains_cache_size:
+                self._domains_cache.clear()
+            # Concurrent misses all return the first published result.
+            domains = self._domains_cache.setdefault(key, domains)
+        return domains
+
     @reflection.cache
     def get_columns(self, connection, table_name, schema=None, **kw):
         """
@@ -823,23 +1213,30 @@ class RedshiftDialectMixin(DefaultDialect):
         :meth:`~sqlalchemy.engine.interfaces.Dialect.get_columns`.
         """
         cols = self._get_redshift_columns(connection, table_name, schema, **kw)
-        if not self._domains:
-            self._domains = self._load_domains(connection)
-        domains = self._domains
-        columns = []
-        for col in cols:
-            column_info = self._get_redshift_column_info(
-                name=col.name, format_type=col.format_type,
+        domains = self._get_domains(connection)
+        # Redshift has no enums; share one empty lookup for every column.
+        enums = {}
+        get_column_info = self._get_redshift_column_info
+        # Column names repeat across tables (id, created_at, ...), so they
+        # are interned to share one string object per distinct name.
+        return [
+            get_column_info(
+                name=sys.intern(col.name), format_type=col.format_type,
                 default=col.default, notnull=col.notnull, domains=domains,
-                enums=[], schema=col.schema, encode=col.encode,
+                enums=enums, schema=col.schema, encode=col.encode,
                 comment=col.comment)
-            columns.append(column_info)
-        return columns
+            for col in cols
+        ]
 
     @reflection.cache
     def has_table(self, connection, table_name, schema=None, **kw):
         if not schema:
-            schema = inspect(connection).default_schema_name
+            schema = self.default_schema_name
+
+        if self._get_cached_relation_data(
+            'relations', connection, table_name, schema
+        ) is not None:
+            return True
 
         info_cache = kw.get('info_cache')
         table = self._get_all_relation_info(connection,
@@ -851,24 +1248,29 @@ class RedshiftDialectMixin(DefaultDialect):
 
     @reflection.cache
     def get_check_constraints(self, connection, table_name, schema=None, **kw):
-        datashare, _, has_datashare = parse_datashare(schema)
-        table_oid = self.get_table_oid(
-            connection, table_name, schema, info_cache=kw.get("info_cache"), datashare=datashare,
+        all_check_constraints = self._get_all_check_constraints(
+            connection, schema=schema, info_cache=kw.get('info_cache')
         )
-        table_oid = 'NULL' if not table_oid else table_oid
-
-        result = connection.execute(sa.text("""
-                        SELECT
-                            cons.conname as name,
-                            pg_get_constraintdef(cons.oid) as src
-                        FROM
-                            pg_catalog.pg_constraint cons
-                        WHERE
-                            cons.conrelid = {} AND
-                            cons.contype = 'c'
-                        """.format(table_oid)))
+        if schema is None:
+            keys = [(table_name, None),
+                    (RelationKey._unquote(table_name), None)]
+        else:
+            key = RelationKey(table_name, schema)
+            keys = [key, key.unquoted()]
+        for key in keys:
+            check_constraints = all_check_constraints.get(key)
+            if check_constraints is not None:
+                break
+        else:
+            # Not a regular relation; external and datashare tables have
+            # no CHECK constraints, anything else does not exist.
+            self._get_redshift_relation(
+                connection, table_name, schema,
+                info_cache=kw.get('info_cache')
+            )
+            check_constraints = []
         ret = []
-        for name, src in result:
+        for name, src in check_constraints:
             # samples:
             # "CHECK (((a > 1) AND (a < 5)))"
             # "CHECK (((a = 1) OR ((a > 2) AND (a < 5))))"
@@ -876,16 +1278,15 @@ class RedshiftDialectMixin(DefaultDialect):
             # "CHECK (some_boolean_function(a))"
             # "CHECK (((a\n < 1)\n OR\n (a\n >= 5))\n)"
 
-            m = re.match(
-                r"^CHECK *\((.+)\)( NOT VALID)?$", src, flags=re.DOTALL
-            )
+            m = _CHECK_CONSTRAINT_RE.match(src)
             if not m:
                 logger.warning(f"Could not parse CHECK constraint text: {src}")
                 sqltext = ""
             else:
-                sqltext = re.compile(
-                    r"^[\s\n]*\((.+)\)[\s\n]*$", flags=re.DOTALL
-                ).sub(r"\1", m.group(1))
+                sqltext = m.group(1).strip()
+                if (len(sqltext) > 2 and sqltext[0] == "("
+                        and sqltext[-1] == ")"):
+                    sqltext = sqltext[1:-1]
             entry = {"name": name, "sqltext": sqltext}
             if m and m.group(2):
                 entry["dialect_options"] = {"not_valid": True}
@@ -898,69 +1299,54 @@ class RedshiftDialectMixin(DefaultDialect):
         """Fetch the oid for schema.table_name.
         Return None if not found (external table does not have table oid)"""
 
+        # Reflection has usually fetched the relation already, and its row
+        # carries the oid; only probe with regclass if it is not known.
+        relation = self._get_known_relation(
+            connection, table_name, schema, kw.get('info_cache'))
+        if relation is not None:
+            return relation.rel_oid
+
         datashare, clean_schema, has_datashare = parse_datashare(schema)
-        schema_field = '{schema}.'.format(schema=schema) if schema else ""
+        if schema:
+            qualified = '{}.{}'.format(schema, table_name)
+        else:
+            qualified = table_name
 
         try:
             result = connection.execute(
-                sa.text(
-                    """
-                    select '{schema_field}{table_name}'::regclass::oid;
-                    """.format(
-                        schema_field=schema_field,
-                        table_name=table_name
-                    )
-                )
+                sa.text("SELECT CAST(:qualified AS regclass)::oid"),
+                {'qualified': qualified},
             )
 
             return result.scalar()
         except Exception as e:
             # Gracefully handle external tables
-            schema_filter = (
-                "AND schemaname = '{schema}'".format(schema=schema)
-                if schema else ""
-            )
             if not has_datashare:
-                result = connection.execute(
-                    sa.text(
-                        """
-                        SELECT
-                            1
-                        FROM svv_external_tables
-                        WHERE
-                            tablename = '{table_name}'
-                            {schema_filter}
-                        LIMIT 1;
-                        """.format(
-                            schema_filter=schema_filter,
-                            table_name=table_name
-                        )
-                    )
+                query = """
+                    SELECT 1
+                    FROM svv_external_tables
+                    WHERE tablename = :table_name {schema_filter}
+                    LIMIT 1
+                """.format(
+                    schema_filter="AND schemaname = :schema" if schema else ""
                 )
             else:
-                datashare_filter = "AND database_name = '{datashare}'".format(datashare=datashare)
-                schema_filter = (
-                    "AND schema_name = '{schema}'".format(schema=clean_schema)
-                    if clean_schema else ""
-                )
-                result = connection.execute(
-                    sa.text(
-                        """
-                        SELECT
-                            1
-                        FROM svv_redshift_tables
-                        WHERE
-                            table_name = '{table_name}'
-                            {schema_filter}
-                            {datashare_filter}
-                        LIMIT 1;
-                        """.format(
-                            schema_filter=schema_filter,
-                            datashare_filter=datashare_filter,
-                            table_name=table_name
-                        )
+                query = """
+                    SELECT 1
+                    FROM svv_redshift_tables
+                    WHERE table_name = :table_name {schema_filter}
+                      AND database_name = :datashare
+                    LIMIT 1
+                """.format(
+                    schema_filter=(
+                        "AND schema_name = :schema" if clean_schema else ""
                     )
                 )
+            result = connection.execute(sa.text(query), {
+                'table_name': table_name,
+                'schema': clean_schema,
+                'datashare': datashare,
+            })
             if result.scalar() is not None:
                 return None
             raise e
@@ -979,11 +1365,8 @@ class RedshiftDialectMixin(DefaultDialect):
         if not pk_constraints:
             return {'constrained_columns': [], 'name': ''}
         pk_constraint = pk_constraints[0]
-        m = PRIMARY_KEY_RE.match(pk_constraint.condef)
-        colstring = m.group('columns')
-        constrained_columns = SQL_IDENTIFIER_RE.findall(colstring)
         return {
-            'constrained_columns': constrained_columns,
+            'constrained_columns': _parse_primary_key(pk_constraint.condef),
             'name': pk_constraint.conname,
         }
 
@@ -997,20 +1380,15 @@ class RedshiftDialectMixin(DefaultDialect):
         """
         constraints = self._get_redshift_constraints(connection, table_name,
                                                      schema, **kw)
-        fk_constraints = [c for c in constraints if c.contype == 'f']
-        uniques = defaultdict(lambda: defaultdict(dict))
-        for con in fk_constraints:
-            uniques[con.conname]["key"] = con.conkey
-            uniques[con.conname]["condef"] = con.condef
+        # One row per constrained column; the definition is per constraint.
+        condefs = {}
+        for con in constraints:
+            if con.contype == 'f':
+                condefs[con.conname] = con.condef
         fkeys = []
-        for conname, attrs in uniques.items():
-            m = FOREIGN_KEY_RE.match(attrs['condef'])
-            colstring = m.group('referred_columns')
-            referred_columns = SQL_IDENTIFIER_RE.findall(colstring)
-            referred_table = m.group('referred_table')
-            referred_schema = m.group('referred_schema')
-            colstring = m.group('columns')
-            constrained_columns = SQL_IDENTIFIER_RE.findall(colstring)
+        for conname, condef in condefs.items():
+            (constrained_columns, referred_schema, referred_table,
+             referred_columns) = _parse_foreign_key(condef)
             fkey_d = {
                 'name': conname,
                 'constrained_columns': constrained_columns,
@@ -1053,12 +1431,14 @@ class RedshiftDialectMixin(DefaultDialect):
         view = self._get_redshift_relation(connection, view_name, schema, **kw)
         return sa.text(view.view_definition)
 
-    def get_indexes(self, connection, table_name, schema, **kw):
+    @staticmethod
+    def get_indexes(connection, table_name, schema=None, **kw):
         """
         Return information about indexes in `table_name`.
 
         Because Redshift does not support traditional indexes,
-        this always returns an empty list.
+        this always returns an empty list, without touching the
+        connection or the reflection cache.
 
         Overrides interface
         :meth:`~sqlalchemy.engine.interfaces.Dialect.get_indexes`.
@@ -1070,7 +1450,7 @@ class RedshiftDialectMixin(DefaultDialect):
         if text is None:
             return None
 
-        if text.startswith('"') and text.endswith('"'):
+        if len(text) >= 2 and text[0] == '"' == text[-1]:
             return text[1:-1]
 
         return text
@@ -1086,11 +1466,14 @@ class RedshiftDialectMixin(DefaultDialect):
         """
         constraints = self._get_redshift_constraints(connection,
                                                      table_name, schema, **kw)
-        constraints = [c for c in constraints if c.contype == 'u']
-        uniques = defaultdict(lambda: defaultdict(dict))
+        uniques = {}
         for con in constraints:
-            uniques[con.conname]["key"] = con.conkey
-            uniques[con.conname]["cols"][con.attnum] = con.attname
+            if con.contype != 'u':
+                continue
+            uc = uniques.get(con.conname)
+            if uc is None:
+                uc = uniques[con.conname] = {"key": con.conkey, "cols": {}}
+            uc["cols"][con.attnum] = con.attname
 
         return [
             {'name': name,
@@ -1107,19 +1490,21 @@ class RedshiftDialectMixin(DefaultDialect):
         Overrides interface
         :meth:`~sqlalchemy.engine.Inspector.get_table_options`.
         """
-        def keyfunc(column):
-            num = int(column.sortkey)
-            # If sortkey is interleaved, column numbers alternate
-            # negative values, so take abs.
-            return abs(num)
         table = self._get_redshift_relation(connection, table_name,
                                             schema, **kw)
         columns = self._get_redshift_columns(connection, table_name,
                                              schema, **kw)
-        sortkey_cols = sorted([col for col in columns if col.sortkey],
-                              key=keyfunc)
-        interleaved = any([int(col.sortkey) < 0 for col in sortkey_cols])
-        sortkey = tuple(col.name for col in sortkey_cols)
+        # If sortkey is interleaved, column numbers alternate
+        # negative values, so order by abs. Positions are unique, so the
+        # tuples sort on their first item without a key function.
+        sortkey_cols = []
+        for col in columns:
+            if col.sortkey:
+                num = int(col.sortkey)
+                sortkey_cols.append((abs(num), num < 0, col.name))
+        sortkey_cols.sort()
+        interleaved = any(negative for _, negative, _ in sortkey_cols)
+        sortkey = tuple(name for _, _, name in sortkey_cols)
         interleaved_sortkey = None
         if interleaved:
             interleaved_sortkey = sortkey
@@ -1135,17 +1520,18 @@ class RedshiftDialectMixin(DefaultDialect):
         }
 
     def _get_table_or_view_names(self, relkind, connection, schema=None, **kw):
-        default_schema = inspect(connection).default_schema_name
+        default_schema = self.default_schema_name
         if not schema:
             schema = default_schema
         info_cache = kw.get('info_cache')
         all_relations = self._get_all_relation_info(connection,
                                                     schema=schema,
+                                                    relkind=relkind,
                                                     info_cache=info_cache)
         relation_names = []
-        for key, relation in all_relations.items():
-            if key.schema == schema and relation.relkind == relkind:
-                relation_names.append(self.unquote(key.name))
+        for name, relation_schema in all_relations:
+            if relation_schema == schema:
+                relation_names.append(self.unquote(name))
         return relation_names
 
 
@@ -1167,7 +1553,7 @@ class RedshiftDialectMixin(DefaultDialect):
         def _handle_array_type(attype):
             return (
                 # strip '[]' from integer[], etc.
-                re.sub(r"\[\]$", "", attype),
+                _ARRAY_SUFFIX_RE.sub("", attype),
                 attype.endswith("[]"),
             )
 
@@ -1180,7 +1566,7 @@ class RedshiftDialectMixin(DefaultDialect):
 
             # strip (*) from character varying(5), timestamp(5)
             # with time zone, geometry(POLYGON), etc.
-            attype = re.sub(r"\(.*\)", "", format_type)
+            attype = _PARENS_STRIP_RE.sub("", format_type)
 
             # strip '[]' from integer[], etc. and check if an array
             attype, is_array = _handle_array_type(attype)
@@ -1190,12 +1576,12 @@ class RedshiftDialectMixin(DefaultDialect):
 
         nullable = not notnull
 
-        charlen = re.search(r"\(([\d,]+)\)", format_type)
+        charlen = _CHARLEN_RE.search(format_type)
         if charlen:
             charlen = charlen.group(1)
-        args = re.search(r"\((.*)\)", format_type)
+        args = _ARGS_RE.search(format_type)
         if args and args.group(1):
-            args = tuple(re.split(r"\s*,\s*", args.group(1)))
+            args = tuple(_COMMA_SPLIT_RE.split(args.group(1)))
         else:
             args = ()
         kwargs = {}
@@ -1231,7 +1617,7 @@ class RedshiftDialectMixin(DefaultDialect):
             else:
                 args = ()
         elif attype.startswith("interval"):
-            field_match = re.match(r"interval (.+)", attype, re.I)
+            field_match = _INTERVAL_RE.match(attype)
             if charlen:
                 kwargs["precision"] = int(charlen)
             if field_match:
@@ -1302,7 +1688,7 @@ class RedshiftDialectMixin(DefaultDialect):
         # adjust the default value
         autoincrement = False
         if default is not None:
-            match = re.search(r"""(nextval\(')([^']+)('.*$)""", default)
+            match = _NEXTVAL_RE.search(default)
             if match is not None:
                 if issubclass(coltype._type_affinity, sqltypes.Integer):
                     autoincrement = True
@@ -1337,14 +1723,14 @@ class RedshiftDialectMixin(DefaultDialect):
     def _get_redshift_column_info(self, *args, **kwargs):
         kw = kwargs.copy()
         encode = kw.pop('encode', None)
-        if sa_version >= Version('1.3.16'):
+        if _SA_GE_1_3_16:
             # SQLAlchemy 1.3.16 introduced generated columns,
             # not supported in redshift
             kw['generated'] = ''
 
-        if sa_version < Version('1.4.0') and 'identity' in kw:
+        if not _SA_GE_1_4 and 'identity' in kw:
             del kw['identity']
-        elif sa_version >= Version('1.4.0') and 'identity' not in kw:
+        elif _SA_GE_1_4 and 'identity' not in kw:
             kw['identity'] = None
 
         column_info = self._get_column_info(
@@ -1357,25 +1743,134 @@ class RedshiftDialectMixin(DefaultDialect):
         if 'info' not in column_info:
             column_info['info'] = {}
         if encode and encode != 'none':
-            column_info['info']['encode'] = encode
+            column_info['info']['encode'] = sys.intern(encode)
         return column_info
 
+    @contextlib.contextmanager
+    def caching_schema(self, connection, schema=None):
+        """
+        Prefetch reflection data for a whole schema while in this context.
+
+        Relation, column and constraint information for `schema` is fetched
+        with one query each on entry, and reflection calls for relations
+        of that schema are then answered from memory instead of querying
+        Redshift once per table. Relations outside the prefetched data are
+        reflected as usual. The data is attached to `connection` only;
+        other connections of the engine are not affected.
+
+        >>> import sqlalchemy as sa
+        >>> engine = sa.create_engine('redshift+psycopg2://example')
+        >>> metadata = sa.MetaData()
+        >>> with engine.connect() as conn:  # doctest: +SKIP
+        ...     with engine.dialect.caching_schema(conn, 'public'):
+        ...         metadata.reflect(conn, schema='public')
+        """
+        # The prefetched data belongs to this connection only; other
+        # connections sharing the dialect keep reflecting as usual.
+        snapshots = connection.info.setdefault(_REFLECTION_SNAPSHOTS_KEY, {})
+        missing = object()
+        previous = snapshots.get(schema, missing)
+        snapshots[schema] = {
+            'relations': self._get_all_relation_info(
+                connection, schema=schema),
+            'columns': self._get_schema_column_info(
+                connection, schema=schema),
+            'constraints': self._get_all_constraint_info(
+                connection, schema=schema),
+        }
+        try:
+            yield
+        finally:
+            if previous is missing:
+                snapshots.pop(schema, None)
+            else:
+                snapshots[schema] = previous
+
+    def _get_cached_relation_data(self, kind, connection, table_name,
+                                  schema=None):
+        """
+        Look up `kind` data for a relation prefetched by caching_schema().
+
+        Returns None if no schema is being cached or the relation is not
+        part of it.
+        """
+        # SQLAlchemy 1.3's Inspector reflects through the Engine, which
+        # has no info dict and so never carries a snapshot.
+        info = getattr(connection, 'info', None)
+        if info is None:
+            return None
+        snapshots = info.get(_REFLECTION_SNAPSHOTS_KEY)
+        if not snapshots:
+            return None
+        cache = snapshots.get(schema)
+        if cache is None and schema is not None:
+            # A snapshot taken without a schema covers every schema.
+            cache = snapshots.get(None)
+        if cache is None:
+            return None
+        relations = cache['relations']
+        key = RelationKey(table_name, schema, connection)
+        relation = relations.get(key)
+        if relation is None:
+            key = key.unquoted()
+            relation = relations.get(key)
+            if relation is None:
+                return None
+        if kind == 'relations':
+            return relation
+        return cache[kind].get(key, [])
+
+    def _get_known_relation(self, connection, table_name, schema,
+                            info_cache):
+        """
+        Return the relation row if it has already been fetched, else None.
+
+        Only caching_schema() snapshots and the `info_cache` entry left by
+        _get_redshift_relation() are consulted; no query is run.
+        """
+        relation = self._get_cached_relation_data(
+            'relations', connection, table_name, schema)
+        if relation is not None or not info_cache:
+            return relation
+        # The key reflection.cache builds for _get_redshift_relation()'s
+        # call of _get_all_relation_info().
+        all_relations = info_cache.get((
+            '_get_all_relation_info', (),
+            (('schema', schema), ('table_name', table_name)),
+        ))
+        if all_relations is None:
+            return None
+        key = RelationKey(table_name, schema, connection)
+        relation = all_relations.get(key)
+        if relation is None:
+            relation = all_relations.get(key.unquoted())
+        return relation
+
     def _get_redshift_relation(self, connection, table_name,
                                schema=None, **kw):
+        cached = self._get_cached_relation_data(
+            'relations', connection, table_name, schema)
+        if cached is not None:
+            return cached
         info_cache = kw.get('info_cache')
         all_relations = self._get_all_relation_info(connection,
                                                     schema=schema,
                                                     table_name=table_name,
                                                     info_cache=info_cache)
         key = RelationKey(table_name, schema, connection)
-        if key not in all_relations.keys():
+        relation = all_relations.get(key)
+        if relation is None:
             key = key.unquoted()
-        try:
-            return all_relations[key]
-        except KeyError:
-            raise sa.exc.NoSuchTableError(key)
+            relation = all_relations.get(key)
+            if relation is None:
+                raise sa.exc.NoSuchTableError(key)
+        return relation
 
     def _get_redshift_columns(self, connection, table_name, schema=None, **kw):
+        cached = self._get_cached_relation_data(
+            'columns', connection, table_name, schema)
+        if cached is not None:
+            return cached
         info_cache = kw.get('info_cache')
         all_schema_columns = self._get_schema_column_info(
             connection,
@@ -1384,110 +1879,53 @@ class RedshiftDialectMixin(DefaultDialect):
             info_cache=info_cache
         )
         key = RelationKey(table_name, schema, connection)
-        if key not in all_schema_columns.keys():
-            key = key.unquoted()
-        return all_schema_columns[key]
+        columns = all_schema_columns.get(key)
+        if columns is None:
+            columns = all_schema_columns[key.unquoted()]
+        return columns
 
     def _get_redshift_constraints(self, connection, table_name,
                                   schema=None, **kw):
+        cached = self._get_cached_relation_data(
+            'constraints', connection, table_name, schema)
+        if cached is not None:
+            return cached
         info_cache = kw.get('info_cache')
         all_constraints = self._get_all_constraint_info(connection,
                                                         schema=schema,
                                                         table_name=table_name,
                                                         info_cache=info_cache)
         key = RelationKey(table_name, schema, connection)
-        if key not in all_constraints.keys():
-            key = key.unquoted()
-        return all_constraints[key]
+        constraints = all_constraints.get(key)
+        if constraints is None:
+            constraints = all_constraints[key.unquoted()]
+        return constraints
 
     @reflection.cache
     def _get_all_relation_info(self, connection, **kw):
         schema = kw.get('schema', None)
         # This goes before using schema because it does cleanup
         datashare, _, has_datashare = parse_datashare(schema)
-        datashare_clause = (
-                "AND s.database_name = '{datashare}'".format(datashare=datashare) if has_datashare else ""
-        )
-        schema_clause = (
-            "AND schema = '{schema}'".format(schema=schema) if schema else ""
-        )
-
-        ## This could also be passed but, if not then present in the schema it needs to be added
-        ## because subsequent reflective calls do not pass through custom attributes.
-        # datashare = kw.get('datashare', None)
-
-
-
-
         table_name = kw.get('table_name', None)
-        table_clause = (
-            "AND relname = '{table}'".format(
-                table=table_name
-            ) if table_name else ""
+        # Only listing table or view names narrows the relation kind.
+        relkind = kw.get('relkind', None)
+        result = connection.execute(
+            _RELATION_SQL_VARIANTS[
+                bool(schema), bool(table_name), has_datashare, bool(relkind)
+            ],
+            {
+                'schema': schema,
+                'table_name': table_name,
+                'datashare': datashare,
+                'relkind': relkind,
+            },
         )
-
-        result = connection.execute(sa.text("""
-        SELECT
-          c.relkind,
-          n.oid as "schema_oid",
-          n.nspname as "schema",
-          c.oid as "rel_oid",
-          c.relname,
-          CASE c.reldiststyle
-            WHEN 0 THEN 'EVEN' WHEN 1 THEN 'KEY' WHEN 8 THEN 'ALL' END
-            AS "diststyle",
-          c.relowner AS "owner_id",
-          u.usename AS "owner_name",
-          TRIM(TRAILING ';' FROM pg_catalog.pg_get_viewdef(c.oid, true))
-            AS "view_definition",
-          pg_catalog.array_to_string(c.relacl, '\n') AS "privileges"
-        FROM pg_catalog.pg_class c
-             LEFT JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
-             JOIN pg_catalog.pg_user u ON u.usesysid = c.relowner
-        WHERE c.relkind IN ('r', 'v', 'm', 'S', 'f')
-          AND n.nspname !~ '^pg_' {schema_clause} {table_clause}
-        UNION
-        SELECT
-            'r' AS "relkind",
-            s.esoid AS "schema_oid",
-            s.schemaname AS "schema",
-            null AS "rel_oid",
-            t.tablename AS "relname",
-            null AS "diststyle",
-            s.esowner AS "owner_id",
-            u.usename AS "owner_name",
-            null AS "view_definition",
-            null AS "privileges"
-        FROM
-            svv_external_tables t
-            JOIN svv_external_schemas s ON s.schemaname = t.schemaname
-            JOIN pg_catalog.pg_user u ON u.usesysid = s.esowner
-        where 1 {schema_clause} {table_clause}
-        UNION
-        SELECT
-            'r' AS relkind,
-            NULL AS schema_oid,  -- Not available in svv_redshift_schemas
-            s.database_name || '.' || s.schema_name AS schema,
-            NULL AS rel_oid,
-            t.table_name AS relname,
-            NULL AS diststyle,
-            NULL AS owner_id,
-            NULL AS owner_name,
-            NULL AS view_definition,
-            NULL AS privileges
-        FROM
-            svv_redshift_tables t
-            LEFT JOIN svv_redshift_schemas s ON s.schema_name = t.schema_name
-        WHERE 1
-            {datashare_clause} {schema_clause} {table_clause}
-        ORDER BY "relkind", "schema_oid", "schema";
-
-       
-        """.format(schema_clause=schema_clause, table_clause=table_clause,datashare_clause=datashare_clause)))
+        # The _get_all_* results are keyed by plain (name, schema) tuples,
+        # which hash and compare equal to the RelationKey used to look
+        # them up, without constructing a RelationKey per row.
         relations = {}
         for rel in result:
-            key = RelationKey(rel.relname, rel.schema, connection)
-            relations[key] = rel
+            relations[rel.relname, rel.schema] = rel
         return relations
 
     # We fetch column info an entire schema at a time to improve performance
@@ -1498,133 +1936,88 @@ class RedshiftDialectMixin(DefaultDialect):
         schema = self.unquote(schema)
         # datashare = kw.get('datashare', None)
         datashare, _, has_datashare = parse_datashare(schema)
-        schema_clause = (
-            "AND schema = '{schema}'".format(schema=schema) if schema else ""
-        )
-
-
-        datashare_clause = (
-                "AND c.database_name = '{datashare}'".format(datashare=datashare) if datashare else ""
-        )
-
         table_name = kw.get('table_name', None)
-        table_clause = (
-            "AND table_name = '{table}'".format(
-                table=table_name
-            ) if table_name else ""
-        )
-
-        unambiguous_tablename_clause = (
-            "AND c.table_name = '{table}'".format(
-                table=table_name
-            ) if table_name else ""
-        )
 
         all_columns = defaultdict(list)
-        result = connection.execute(sa.text(REFLECTION_SQL.format(
-            schema_clause=schema_clause,
-            table_clause=table_clause,
-            unambiguous_tablename_clause=unambiguous_tablename_clause,
-            datashare_clause=datashare_clause,
-        )))
+        result = connection.execute(
+            _REFLECTION_SQL_VARIANTS[
+                bool(schema), bool(table_name), bool(datashare)
+            ],
+            {
+                'schema': schema,
+                'table_name': table_name,
+                'datashare': datashare,
+            },
+        )
 
-        for col in result:
-            key = RelationKey(col.table_name, col.schema, connection)
-            all_columns[key].append(col)
+        for (rel_schema, table_name), cols in itertools.groupby(
+                result, key=_schema_and_table):
+            all_columns[table_name, rel_schema].extend(cols)
 
         return dict(all_columns)
 
     @reflection.cache
     def _get_all_constraint_info(self, connection, **kw):
         schema = kw.get('schema', None)
-        #datashare = kw.get('datashare', None)
         datashare, _, has_datashare = parse_datashare(schema)
-        schema_clause = (
-            "AND schema = '{schema}'".format(schema=schema) if schema else ""
-        )
-
-
-        datashare_clause = (
-                "AND c.database_name = '{datashare}'".format(datashare=datashare) if datashare else ""
-        )
-
         table_name = kw.get('table_name', None)
-        table_clause = (
-            "AND table_name = '{table}'".format(
-                table=table_name
-            ) if table_name else ""
-        )
-        unambiguous_table_clause = (
-            "AND c.table_name = '{table}'".format(
-                table=table_name
-            ) if table_name else ""
+        result = connection.execute(
+            _CONSTRAINT_SQL_VARIANTS[
+                bool(schema), bool(table_name), bool(datashare)
+            ],
+            {
+                'schema': schema,
+                'table_name': table_name,
+                'datashare': datashare,
+            },
         )
-
-        result = connection.execute(sa.text("""
-        SELECT
-          n.nspname as "schema",
-          c.relname as "table_name",
-          t.contype,
-          t.conname,
-          t.conkey,
-          a.attnum,
-          a.attname,
-          pg_catalog.pg_get_constraintdef(t.oid, true)::varchar(512) as condef,
-          n.oid as "schema_oid",
-          c.oid as "rel_oid"
-        FROM pg_catalog.pg_class c
-        LEFT JOIN pg_catalog.pg_namespace n
-          ON n.oid = c.relnamespace
-        JOIN pg_catalog.pg_constraint t
-          ON t.conrelid = c.oid
-        JOIN pg_catalog.pg_attribute a
-          ON t.conrelid = a.attrelid AND a.attnum = ANY(t.conkey)
-        WHERE n.nspname !~ '^pg_' {schema_clause} {table_clause}
-        UNION
-        SELECT
-            s.schemaname AS "schema",
-            c.tablename AS "table_name",
-            'p' as "contype",
-            c.tablename || '_pkey' as "conname",
-            array[1::SMALLINT] as "conkey",
-            1 as "attnum",
-            c.columnname as "attname",
-            'PRIMARY KEY (' || c.columnname  || ')'::VARCHAR(512) as "condef",
-            s.esoid AS "schema_oid",
-            null AS "rel_oid"
-        FROM
-            svv_external_columns c
-            JOIN svv_external_schemas s ON s.schemaname = c.schemaname
-        where 1 {schema_clause} {table_clause}
-        UNION
-        SELECT
-            c.database_name || '.' || c.schema_name AS "schema",
-            c.table_name AS "table_name",
-            'p' AS "contype",
-            c.table_name || '_pkey' AS "conname",
-            array[1::SMALLINT] AS "conkey",
-            1 AS "attnum",
-            c.column_name AS "attname",
-            'PRIMARY KEY (' || c.column_name || ')'::VARCHAR(512) AS "condef",
-            null AS "schema_oid",
-            null AS "rel_oid"
-        FROM
-            svv_redshift_columns c
-            JOIN svv_redshift_tables t ON t.schema_name = c.schema_name AND t.table_name = c.table_name
-        WHERE 1 {datashare_clause} {schema_clause} {unambiguous_table_clause}
-        ORDER BY "schema", "table_name"
-        """.format(schema_clause=schema_clause, table_clause=table_clause,
-                   unambiguous_table_clause=unambiguous_table_clause, datashare_clause=datashare_clause)))
         all_constraints = defaultdict(list)
-        for con in result:
-            key = RelationKey(con.table_name, con.schema, connection)
-            all_constraints[key].append(con)
+        for (rel_schema, table_name), cons in itertools.groupby(
+                result, key=_schema_and_table):
+            all_constraints[table_name, rel_schema].extend(cons)
         return all_constraints
 
+    # CHECK constraints are fetched for a whole schema at once, so reflecting
+    # its tables costs one query rather than one (plus an oid lookup) each.
+    @reflection.cache
+    def _get_all_check_constraints(self, connection, **kw):
+        schema = kw.get('schema', None)
+        if parse_datashare(schema)[2]:
+            # Datashare and external tables carry no CHECK constraints.
+            return {}
+        result = connection.execute(
+            _CHECK_CONSTRAINT_SQL_VARIANTS[schema is not None],
+            {'schema': self.unquote(schema)}
+        )
+        # Without a schema, visible relations are keyed by name alone.
+        all_check_constraints = {}
+        for con in result:
+            key = (con.table_name, None if schema is None else con.schema)
+            check_constraints = all_check_constraints.setdefault(key, [])
+            if con.name is not None:
+                check_constraints.append((con.name, con.src))
+        return all_check_constraints
+
     def _set_backslash_escapes(self, connection):
         self._backslash_escapes = False
 
 
+# Default connection arguments, overridden by anything from the URL or
+# connect_args. The CA bundle path is resolved once, at import.
+_PSYCOPG2_DEFAULT_ARGS = MappingProxyType({
+    'sslmode': 'verify-full',
+    'sslrootcert': str(
+        Path(__file__).parent.resolve() / 'redshift-ca-bundle.crt'
+    ),
+})
+
+_REDSHIFT_CONNECTOR_DEFAULT_ARGS = MappingProxyType({
+    'sslmode': 'verify-full',
+    'ssl': True,
+    'application_name': 'sqlalchemy-redshift'
+})
+
+
 class Psycopg2RedshiftDialectMixin(RedshiftDialectMixin):
     """
     Define behavior specific to ``psycopg2``.
@@ -1640,33 +2033,33 @@ class Psycopg2RedshiftDialectMixin(RedshiftDialectMixin):
         Overrides interface
         :meth:`~sqlalchemy.engine.interfaces.Dialect.create_connect_args`.
         """
-        cwd = Path(__file__).parent.resolve()
-        default_args = {
-            'sslmode': 'verify-full',
-            'sslrootcert': str(cwd / 'redshift-ca-bundle.crt'),
-        }
         cargs, cparams = (
             super(Psycopg2RedshiftDialectMixin, self).create_connect_args(
                 *args, **kwargs
             )
         )
-        default_args.update(cparams)
-        return cargs, default_args
+        return cargs, {**_PSYCOPG2_DEFAULT_ARGS, **cparams}
 
     @classmethod
     def dbapi(cls):
+        # Cached per class, as psycopg2 and psycopg2cffi share this method.
+        driver_module = cls.__dict__.get('_dbapi_module')
+        if driver_module is not None:
+            return driver_module
         try:
-            return importlib.import_module(cls.driver)
+            driver_module = importlib.import_module(cls.driver)
         except ImportError:
             raise ImportError(
                 'No module named {}'.format(cls.driver)
             )
+        cls._dbapi_module = driver_module
+        return driver_module
 
 
 class RedshiftDialect_psycopg2(
     Psycopg2RedshiftDialectMixin, PGDialect_psycopg2
 ):
-    supports_statement_cache = False
+    supports_statement_cache = True
 
 
 # Add RedshiftDialect synonym for backwards compatibility.
@@ -1676,45 +2069,52 @@ RedshiftDialect = RedshiftDialect_psycopg2
 class RedshiftDialect_psycopg2cffi(
     Psycopg2RedshiftDialectMixin, PGDialect_psycopg2cffi
 ):
-    supports_statement_cache = False
+    supports_statement_cache = True
+
+
+class RedshiftCompiler_redshift_connector(RedshiftCompiler, PGCompiler):
+    def limit_clause(self, select, **kw):
+        # integer values for limit and offset are rendered inline
+        if select._offset_clause is None:
+            if select._limit_clause is None:
+                return ""
+            return f" \n LIMIT {select._limit}"
+        if select._limit_clause is None:
+            return f"\n LIMIT ALL OFFSET {select._offset}"
+        return f" \n LIMIT {select._limit} OFFSET {select._offset}"
+
+    def visit_mod_binary(self, binary, operator, **kw):
+        return (
+            self.process(binary.left, **kw)
+            + " %% "
+            + self.process(binary.right, **kw)
+        )
 
+    def post_process_text(self, text):
+        if "%" not in text:
+            return text
+        if "%%" in text:
+            util.warn(
+                "The SQLAlchemy postgresql dialect "
+                "now automatically escapes '%' in text() "
+                "expressions to '%%'."
+            )
+        return text.replace("%", "%%")
 
-class RedshiftDialect_redshift_connector(RedshiftDialectMixin, PGDialect):
 
-    class RedshiftCompiler_redshift_connector(RedshiftCompiler, PGCompiler):
-        def limit_clause(self, select, **kw):
-            text = ""
-            if select._limit_clause is not None:
-                # an integer value for limit is retrieved
-                text += " \n LIMIT " + str(select._limit)
-            if select._offset_clause is not None:
-                if select._limit_clause is None:
-                    text += "\n LIMIT ALL"
-                # an integer value for offset is retrieved
-                text += " OFFSET " + str(select._offset)
-            return text
+class RedshiftExecutionContext_redshift_connector(PGExecutionContext):
+    def pre_exec(self):
+        if not self.compiled:
+            return
 
-        def visit_mod_binary(self, binary, operator, **kw):
-            return (
-                self.process(binary.left, **kw)
-                + " %% "
-                + self.process(binary.right, **kw)
-            )
 
-        def post_process_text(self, text):
-            from sqlalchemy import util
-            if "%%" in text:
-                util.warn(
-                    "The SQLAlchemy postgresql dialect "
-                    "now automatically escapes '%' in text() "
-                    "expressions to '%%'."
-                )
-            return text.replace("%", "%%")
+class RedshiftDialect_redshift_connector(RedshiftDialectMixin, PGDialect):
 
-    class RedshiftExecutionContext_redshift_connector(PGExecutionContext):
-        def pre_exec(self):
-            if not self.compiled:
-                return
+    # Still reachable through the dialect, where they used to be nested.
+    RedshiftCompiler_redshift_connector = RedshiftCompiler_redshift_connector
+    RedshiftExecutionContext_redshift_connector = (
+        RedshiftExecutionContext_redshift_connector
+    )
 
     driver = 'redshift_connector'
 
@@ -1727,7 +2127,7 @@ class RedshiftDialect_redshift_connector(RedshiftDialectMixin, PGDialect):
     statement_compiler = RedshiftCompiler_redshift_connector
     execution_ctx_cls = RedshiftExecutionContext_redshift_connector
 
-    supports_statement_cache = False
+    supports_statement_cache = True
     use_setinputsizes = False  # not implemented in redshift_connector
 
     def __init__(self, client_encoding=None, **kwargs):
@@ -1738,6 +2138,9 @@ class RedshiftDialect_redshift_connector(RedshiftDialectMixin, PGDialect):
 
     @classmethod
     def dbapi(cls):
+        driver_module = cls.__dict__.get('_dbapi_module')
+        if driver_module is not None:
+            return driver_module
         try:
             driver_module = importlib.import_module(cls.driver)
 
@@ -1747,6 +2150,7 @@ class RedshiftDialect_redshift_connector(RedshiftDialectMixin, PGDialect):
             else:
                 cls.description_encoding = None
 
+            cls._dbapi_module = driver_module
             return driver_module
         except ImportError:
             raise ImportError(
@@ -1759,12 +2163,22 @@ class RedshiftDialect_redshift_connector(RedshiftDialectMixin, PGDialect):
         Sets the client-side encoding using the provided connection object.
         """
         # adjust for ConnectionFairy possibly being present
-        if hasattr(connection, "connection"):
-            connection = connection.connection
+        connection = getattr(connection, "connection", connection)
+
+        # SET does not take bind parameters, so only plain encoding names
+        # are interpolated.
+        if not _CLIENT_ENCODING_RE.match(client_encoding):
+            raise ValueError(
+                'Invalid client_encoding: {!r}'.format(client_encoding)
+            )
 
         cursor = connection.cursor()
         cursor.execute("SET CLIENT_ENCODING TO '" + client_encoding + "'")
-        cursor.execute("COMMIT")
+        # Outside autocommit the SET runs in an implicit transaction; commit
+        # it so that a rollback when the connection is returned to the pool
+        # does not undo it.
+        if not getattr(connection, 'autocommit', False):
+            cursor.execute("COMMIT")
         cursor.close()
 
     def set_isolation_level(self, connection, level):
@@ -1778,11 +2192,11 @@ class RedshiftDialect_redshift_connector(RedshiftDialectMixin, PGDialect):
         isolation levels.
         https://docs.aws.amazon.com/redshift/latest/dg/r_BEGIN.html
         """
-        level = level.replace("_", " ")
+        if "_" in level:
+            level = level.replace("_", " ")
 
         # adjust for ConnectionFairy possibly being present
-        if hasattr(connection, "connection"):
-            connection = connection.connection
+        connection = getattr(connection, "connection", connection)
 
         if level == "AUTOCOMMIT":
             connection.autocommit = True
@@ -1796,7 +2210,6 @@ class RedshiftDialect_redshift_connector(RedshiftDialectMixin, PGDialect):
         fns = []
 
         def on_connect(conn):
-            from sqlalchemy.sql.elements import quoted_name
             conn.py_types[quoted_name] = conn.py_types[str]
 
         fns.append(on_connect)
@@ -1815,7 +2228,12 @@ class RedshiftDialect_redshift_connector(RedshiftDialectMixin, PGDialect):
 
             fns.append(on_connect)
 
-        if len(fns) > 0:
+        # SQLAlchemy asks for this hook once per engine and runs it for
+        # every new DB-API connection, so keep the per-connection path lean.
+        if len(fns) == 1:
+            return fns[0]
+        elif len(fns) > 1:
+            fns = tuple(fns)
 
             def on_connect(conn):
                 for fn in fns:
@@ -1832,11 +2250,6 @@ class RedshiftDialect_redshift_connector(RedshiftDialectMixin, PGDialect):
         Overrides interface
         :meth:`~sqlalchemy.engine.interfaces.Dialect.create_connect_args`.
         """
-        default_args = {
-            'sslmode': 'verify-full',
-            'ssl': True,
-            'application_name': 'sqlalchemy-redshift'
-        }
         cargs, cparams = super(RedshiftDialectMixin, self).create_connect_args(
             *args, **kwargs
         )
@@ -1846,15 +2259,20 @@ class RedshiftDialect_redshift_connector(RedshiftDialectMixin, PGDialect):
             'client_encoding', self.client_encoding
         )
 
-        if 'port' in cparams:
+        try:
             cparams['port'] = int(cparams['port'])
+        except KeyError:
+            pass
+
+        username = cparams.pop('username', None)
+        if username is not None:
+            cparams['user'] = username
 
-        if 'username' in cparams:
-            cparams['user'] = cparams['username']
-            del cparams['username']
+        return cargs, {**_REDSHIFT_CONNECTOR_DEFAULT_ARGS, **cparams}
 
-        default_args.update(cparams)
-        return cargs, default_args
+
+# Clause types whose children gen_columns_from_children descends into.
+_TRAVERSE_TYPES = (Delete, BinaryExpression, BooleanClauseList)
 
 
 def gen_columns_from_children(root):
@@ -1864,13 +2282,42 @@ def gen_columns_from_children(root):
     :param root: the delete query
     :return: a generator of columns
     """
-    if isinstance(root, (Delete, BinaryExpression, BooleanClauseList)):
-        for child in root.get_children():
-            yc = gen_columns_from_children(child)
-            for it in yc:
-                yield it
-    elif isinstance(root, sa.Column):
-        yield root
+    # Depth-first, left to right: children are pushed in reverse so that
+    # columns come out in the order in which they appear in the query.
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, _TRAVERSE_TYPES):
+            stack.extend(reversed(tuple(node.get_children())))
+        elif isinstance(node, sa.Column):
+            yield node
+
+
+# Tables referenced by a DELETE's where clause, per statement. Statements
+# are immutable once built (.where() returns a copy), so the traversal
+# only has to happen once for each of them.
+_delete_where_tables = weakref.WeakKeyDictionary()
+
+
+def _get_delete_where_tables(element):
+    """
+    Return the tables of the columns used in the delete query `element`,
+    in the order in which they first appear.
+    """
+    tables = _delete_where_tables.get(element)
+    if tables is None:
+        whereclause = getattr(element, 'whereclause', None)
+        if whereclause is not None and all(
+            from_ is element.table for from_ in whereclause._from_objects
+        ):
+            # Only the target table is referenced; no need to walk.
+            tables = (element.table,)
+        else:
+            tables = tuple(dict.fromkeys(
+                col.table for col in gen_columns_from_children(element)
+            ))
+        _delete_where_tables[element] = tables
+    return tables
 
 
 @compiles(Delete, 'redshift')
@@ -1941,32 +2388,26 @@ def visit_delete_stmt(element, compiler, **kwargs):
     #   which they first appear in the where clause.
     delete_stmt_table = compiler.process(element.table, asfrom=True, **kwargs)
 
-    if sa_version >= Version('1.4.0'):
+    if _SA_GE_1_4:
         if element.whereclause is not None:
             clause = compiler.process(element.whereclause, **kwargs)
             if clause:
-                whereclause = ' WHERE {clause}'.format(clause=clause)
+                whereclause = ' WHERE ' + clause
     else:
         whereclause_tuple = element.get_children()
         if whereclause_tuple:
-            whereclause = ' WHERE {clause}'.format(
-                clause=compiler.process(*whereclause_tuple, **kwargs)
+            whereclause = ' WHERE ' + compiler.process(
+                *whereclause_tuple, **kwargs
             )
 
     if whereclause:
-        usingclause_tables = []
-        whereclause_columns = gen_columns_from_children(element)
-        for col in whereclause_columns:
-            table = compiler.process(col.table, asfrom=True, **kwargs)
-            if table != delete_stmt_table and \
-                    table not in usingclause_tables:
-                usingclause_tables.append(table)
+        # dict keys keep first-appearance order and drop repeats
+        usingclause_tables = dict.fromkeys(
+            compiler.process(where_table, asfrom=True, **kwargs)
+            for where_table in _get_delete_where_tables(element)
+        )
+        usingclause_tables.pop(delete_stmt_table, None)
         if usingclause_tables:
-            usingclause = ' USING {clause}'.format(
-                clause=', '.join(usingclause_tables)
-            )
+            usingclause = ' USING ' + ', '.join(usingclause_tables)
 
-    return 'DELETE FROM {table}{using}{where}'.format(
-        table=delete_stmt_table,
-        using=usingclause,
-        where=whereclause)
+    return f'DELETE FROM {delete_stmt_table}{usingclause}{whereclause}'
@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 from alembic.ddl.base import RenameTable, ColumnComment
 from alembic import migration
 
@@ -23,3 +26,39 @@ def test_alter_column_comment(stub_redshift_dialect):
         ColumnComment("table_name", "column_name", "my comment")
     )
     assert sql == "COMMENT ON COLUMN table_name.column_name IS 'my comment'"
+
+
+def test_alembic_registered_when_imported_after_dialect():
+    code = (
+        "import sys\n"
+        "from sqlalchemy_redshift import dialect\n"
+        "assert 'alembic' not in sys.modules\n"
+        "from alembic import migration\n"
+        "context = migration.MigrationContext.configure(\n"
+        "    url='redshift+psycopg2://mydb'\n"
+        ")\n"
+        "assert isinstance(context.impl, dialect.RedshiftImpl)\n"
+        "assert not any(\n"
+        "    isinstance(finder, dialect._AlembicImportHook)\n"
+        "    for finder in sys.meta_path\n"
+        ")\n"
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+def test_redshift_impl_importable_before_alembic():
+    code = (
+        "import sys\n"
+        "from sqlalchemy_redshift import dialect\n"
+        "assert 'alembic' not in sys.modules\n"
+        "from sqlalchemy_redshift.dialect import RedshiftImpl\n"
+        "from alembic.ddl.impl import DefaultImpl\n"
+        "assert DefaultImpl.get_by_dialect(\n"
+        "    dialect.RedshiftDialect_psycopg2()\n"
+        ") is RedshiftImpl\n"
+        "assert not any(\n"
+        "    isinstance(finder, dialect._AlembicImportHook)\n"
+        "    for finder in sys.meta_path\n"
+        ")\n"
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)
@@ -1,5 +1,7 @@
-from sqlalchemy import func, select
+import pytest
+from sqlalchemy import column, func, select, table
 
+from sqlalchemy_redshift.dialect import RedshiftDialect_redshift_connector
 from tests.rs_sqla_test_utils import models
 
 
@@ -15,3 +17,17 @@ def test_unquoting_schema(stub_redshift_dialect):
     compiled = s.compile(dialect=dialect)
     assert "dotted.schema" in str(compiled)
     assert "\"dotted.schema\"" not in str(compiled)
+
+
+@pytest.mark.parametrize('limit, offset, expected', [
+    (None, None, 'SELECT t.a \nFROM t'),
+    (5, None, 'SELECT t.a \nFROM t \n LIMIT 5'),
+    (None, 10, 'SELECT t.a \nFROM t\n LIMIT ALL OFFSET 10'),
+    (5, 10, 'SELECT t.a \nFROM t \n LIMIT 5 OFFSET 10'),
+])
+def test_redshift_connector_limit_clause(limit, offset, expected):
+    dialect = RedshiftDialect_redshift_connector()
+    t = table('t', column('a'))
+    s = t.select().limit(limit).offset(offset)
+    compiled = s.compile(dialect=dialect)
+    assert str(compiled) == expected
@@ -0,0 +1,95 @@
+import pytest
+
+from sqlalchemy_redshift.dialect import (
+    FOREIGN_KEY_RE, PRIMARY_KEY_RE, SQL_IDENTIFIER_RE, _parse_foreign_key,
+    _parse_primary_key, _verbose_to_plain
+)
+
+
+@pytest.mark.parametrize('condef, expected', [
+    (
+        'FOREIGN KEY (col1) REFERENCES othertable(col2)',
+        (['col1'], None, 'othertable', ['col2']),
+    ),
+    (
+        'FOREIGN KEY(col1) REFERENCES other_schema.othertable (col2)',
+        (['col1'], 'other_schema', 'othertable', ['col2']),
+    ),
+    (
+        'FOREIGN KEY (a, "b c", "x)y") REFERENCES "my schema"."t"(c1, "d e")',
+        (['a', '"b c"', '"x)y"'], '"my schema"', '"t"', ['c1', '"d e"']),
+    ),
+])
+def test_foreign_key_re(condef, expected):
+    m = FOREIGN_KEY_RE.match(condef)
+    assert m is not None
+    assert (
+        SQL_IDENTIFIER_RE.findall(m.group('columns')),
+        m.group('referred_schema'),
+        m.group('referred_table'),
+        SQL_IDENTIFIER_RE.findall(m.group('referred_columns')),
+    ) == expected
+
+
+def test_foreign_key_re_rejects_malformed_input():
+    condef = 'FOREIGN KEY (' + 'a ' * 5000 + 'REFERENCES'
+    assert FOREIGN_KEY_RE.match(condef) is None
+
+
+@pytest.mark.parametrize('condef, expected', [
+    ('PRIMARY KEY (col1)', ['col1']),
+    ('PRIMARY KEY (col1, col2)', ['col1', 'col2']),
+    ('PRIMARY KEY ("col, with) stuff", "open")',
+     ['"col, with) stuff"', '"open"']),
+])
+def test_primary_key_re(condef, expected):
+    m = PRIMARY_KEY_RE.match(condef)
+    assert m is not None
+    assert SQL_IDENTIFIER_RE.findall(m.group('columns')) == expected
+
+
+@pytest.mark.parametrize('verbose, plain', [
+    ('  a \\ b  # comment\n c', 'a\\ bc'),
+    ('[ #] x', '[ #]x'),
+    ('[^]# ] x', '[^]# ]x'),
+    ('\\[ a ]', '\\[a]'),
+    ('[\\] ]x', '[\\] ]x'),
+    ('[^\\] ]x', '[^\\] ]x'),
+    ('[a\\] #] x', '[a\\] #]x'),
+    ('[] #] x', '[] #]x'),
+])
+def test_verbose_to_plain(verbose, plain):
+    assert _verbose_to_plain(verbose) == plain
+
+
+@pytest.mark.parametrize('condef, expected', [
+    (
+        'FOREIGN KEY (col1) REFERENCES othertable(col2)',
+        (['col1'], None, 'othertable', ['col2']),
+    ),
+    (
+        'FOREIGN KEY(col1) REFERENCES other_schema.othertable (col2)',
+        (['col1'], 'other_schema', 'othertable', ['col2']),
+    ),
+    (
+        'FOREIGN KEY (a, "b c", "x)y") REFERENCES "my.schema"."t("(c1, "d e")',
+        (['a', '"b c"', '"x)y"'], '"my.schema"', '"t("', ['c1', '"d e"']),
+    ),
+])
+def test_parse_foreign_key(condef, expected):
+    assert _parse_foreign_key(condef) == expected
+
+
+@pytest.mark.parametrize('condef, expected', [
+    ('PRIMARY KEY (col1)', ['col1']),
+    ('PRIMARY KEY (col1, col2)', ['col1', 'col2']),
+    ('PRIMARY KEY ("col, with) stuff", "open")',
+     ['"col, with) stuff"', '"open"']),
+])
+def test_parse_primary_key(condef, expected):
+    assert _parse_primary_key(condef) == expected
+
+
+def test_parse_rejects_unterminated_list():
+    with pytest.raises(ValueError):
+        _parse_primary_key('PRIMARY KEY ("a", b')
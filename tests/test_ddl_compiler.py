@@ -1,7 +1,7 @@
 import difflib
 
 import pytest
-from sqlalchemy import Table, Column, Integer, String, MetaData
+from sqlalchemy import Table, Column, Integer, String, MetaData, text
 from sqlalchemy.exc import ArgumentError
 from sqlalchemy.schema import CreateTable
 
@@ -59,6 +59,30 @@ class TestDDLCompiler(object):
         )
         assert expected == actual, self._compare_strings(expected, actual)
 
+    def test_create_table_with_reflected_identity_default(self, compiler):
+
+        table = Table(
+            't1',
+            MetaData(),
+            Column(
+                'id', Integer, primary_key=True,
+                server_default=text(
+                    '"identity"(445178, 0, \'1,1\'::text)'
+                ),
+            ),
+            Column('name', String, server_default=text("'anon'")),
+        )
+
+        create_table = CreateTable(table)
+        actual = compiler.process(create_table)
+        expected = (
+            u"\nCREATE TABLE t1 ("
+            u"\n\tid INTEGER IDENTITY(1,1) NOT NULL, "
+            u"\n\tname VARCHAR DEFAULT 'anon', "
+            u"\n\tPRIMARY KEY (id)\n)\n\n"
+        )
+        assert expected == actual, self._compare_strings(expected, actual)
+
     def test_create_table_with_diststyle(self, compiler):
 
         table = Table('t1',
@@ -1,3 +1,7 @@
+import datetime
+import json
+import uuid
+
 import pytest
 import sqlalchemy_redshift.dialect
 import sqlalchemy
@@ -187,3 +191,45 @@ def test_custom_type_compilation(custom_datatype):
     dt = custom_datatype()
     compiled_dt = dt.compile()
     assert compiled_dt == dt.__visit_name__
+
+
+@pytest.mark.parametrize("value", [
+    {"a": [1, 2.5, None, True]},
+    [{"nested": {"b": "c"}}],
+    {1: "non-str key"},
+    42,
+])
+def test_super_bind_param_serializes_json(value):
+    processed = sqlalchemy_redshift.dialect.SUPER().process_bind_param(
+        value, None
+    )
+    assert json.loads(processed) == json.loads(json.dumps(value))
+
+
+@pytest.mark.parametrize("value", [
+    {"a": float("nan")},
+    [float("inf"), float("-inf")],
+    {"when": datetime.date(2023, 1, 2)},
+    uuid.UUID(int=1),
+    2 ** 64,
+    {"caf\u00e9": ["\u00fc", 1.5]},
+])
+def test_super_bind_param_matches_json(value):
+    try:
+        expected = json.dumps(value)
+    except TypeError:
+        with pytest.raises(TypeError):
+            sqlalchemy_redshift.dialect.SUPER().process_bind_param(
+                value, None
+            )
+    else:
+        assert sqlalchemy_redshift.dialect.SUPER().process_bind_param(
+            value, None
+        ) == expected
+
+
+def test_super_bind_param_passes_strings_through():
+    value = '{"a": 1}'
+    assert sqlalchemy_redshift.dialect.SUPER().process_bind_param(
+        value, None
+    ) is value
@@ -0,0 +1,14 @@
+import pytest
+
+from sqlalchemy_redshift.dialect import parse_datashare
+
+
+@pytest.mark.parametrize('schema, expected', [
+    (None, (None, None, False)),
+    ('', (None, '', False)),
+    ('public', (None, 'public', False)),
+    ('"my.schema"', (None, '"my.schema"', False)),
+    ('shared_db.public', ('shared_db', 'public', True)),
+])
+def test_parse_datashare(schema, expected):
+    assert parse_datashare(schema) == expected
@@ -186,6 +186,18 @@ def test_reflection(redshift_session, model, ddl):
     assert utils.clean(introspected_ddl) == utils.clean(ddl)
 
 
+@pytest.mark.parametrize("model, ddl", models_and_ddls)
+def test_reflection_with_caching_schema(redshift_session, model, ddl):
+    _dialect = redshift_session.bind.dialect
+    metadata = MetaData(bind=redshift_session.bind)
+    schema = model.__table__.schema
+    with _dialect.caching_schema(redshift_session.connection(), schema):
+        table = Table(model.__tablename__, metadata,
+                      schema=schema, autoload=True)
+    introspected_ddl = table_to_ddl(table, _dialect)
+    assert utils.clean(introspected_ddl) == utils.clean(ddl)
+
+
 def test_no_table_reflection(redshift_session):
     metadata = MetaData(bind=redshift_session.bind)
     with pytest.raises(NoSuchTableError):
@@ -25,3 +25,24 @@ raw_names = [
 def test_unquoted(raw_table, raw_schema):
     key = RelationKey(raw_table, raw_schema)
     assert key.unquoted().__str__() == "schema.table"
+
+
+@pytest.mark.parametrize("part, expected", [
+    (None, None),
+    ('table', 'table'),
+    ('"table"', 'table'),
+    ('""', ''),
+    ('"', '"'),
+    ('"table', '"table'),
+])
+def test_unquote_part(part, expected):
+    assert RelationKey._unquote(part) == expected
+
+
+def test_matches_plain_tuple_keys():
+    # Reflection results are keyed by (name, schema) tuples and looked up
+    # with RelationKey.
+    relations = {('table', 'schema'): 'relation'}
+    assert relations[RelationKey('table', 'schema')] == 'relation'
+    assert relations.get(RelationKey('"table"', 'schema').unquoted()) == \
+        'relation'